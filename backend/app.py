@@ -2,24 +2,71 @@ from __future__ import annotations
 
 import os
 from datetime import datetime
-from typing import Dict, Any
-
-from flask import Flask, jsonify, request, Blueprint
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import click
+import msgspec
+import orjson
+from flask import Flask, Response, current_app, request, Blueprint
+from flask.cli import with_appcontext
+from flask_orjson import OrjsonProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, event, lambda_stmt
+from sqlalchemy.exc import IntegrityError
 
 # Initialize SQLAlchemy without an app, bind in create_app
 # This allows reuse in tests with a fresh app instance
 
 db = SQLAlchemy()
 
+MAX_COMMENT_LEN = 1000
+MAX_AUTHOR_LEN = 120
+MAX_BULK_COMMENTS = 100
+# Bodies above this are rejected by Werkzeug (413) before any JSON parsing.
+# Sized so a full bulk batch fits however it is encoded: with ensure_ascii
+# (Python's json default) a character can take up to 12 bytes, as an escaped
+# surrogate pair "\ud83d\ude00", plus room for per-item keys and punctuation.
+MAX_JSON_BYTES_PER_CHAR = 12
+MAX_REQUEST_BYTES = MAX_BULK_COMMENTS * (
+    MAX_JSON_BYTES_PER_CHAR * (MAX_COMMENT_LEN + MAX_AUTHOR_LEN) + 64
+)
+
+
+def _set_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    # WAL lets readers run alongside a writer; NORMAL sync is safe under WAL
+    # and avoids an fsync on every commit. Reads go through a 256 MiB mmap and
+    # temp tables/indices stay in memory. SQLite leaves FK enforcement off
+    # unless asked, and comment creation relies on it to detect missing tasks.
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def engine_options_for(uri: str) -> Dict[str, Any]:
+    if uri.startswith("sqlite:"):
+        # SQLAlchemy already pools file connections; let them cross threads
+        return {"connect_args": {"check_same_thread": False}}
+    return {"pool_size": 10, "max_overflow": 20, "pool_pre_ping": True, "pool_recycle": 3600}
+
+
+# Stamped in Python rather than with CURRENT_TIMESTAMP: SQLite's is only
+# second-resolution, which would let two quick updates share an ETag
+_utcnow = datetime.utcnow
+
 
 class TimestampMixin:
-    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=_utcnow)
+    updated_at = db.Column(db.DateTime, nullable=False, default=_utcnow, onupdate=_utcnow)
 
 
 class Task(db.Model, TimestampMixin):
     __tablename__ = "tasks"
+    # Lets the listing ETag's MAX(updated_at) read one index entry
+    __table_args__ = (db.Index("ix_tasks_updated_at", "updated_at"),)
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -32,18 +79,25 @@ class Task(db.Model, TimestampMixin):
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            # datetimes are serialized by the orjson provider (RFC 3339)
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
 
 class Comment(db.Model, TimestampMixin):
     __tablename__ = "comments"
+    # (task_id, id) serves "WHERE task_id = ? AND id > ? ORDER BY id" as a single
+    # range scan; (task_id, updated_at) covers the per-task ETag aggregate
+    __table_args__ = (
+        db.Index("ix_comments_task_id_id", "task_id", "id"),
+        db.Index("ix_comments_task_id_updated_at", "task_id", "updated_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    task_id = db.Column(db.Integer, db.ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
-    content = db.Column(db.String(1000), nullable=False)
-    author = db.Column(db.String(120), nullable=True)
+    task_id = db.Column(db.Integer, db.ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    content = db.Column(db.String(MAX_COMMENT_LEN), nullable=False)
+    author = db.Column(db.String(MAX_AUTHOR_LEN), nullable=True)
 
     task = db.relationship("Task", back_populates="comments")
 
@@ -53,15 +107,389 @@ class Comment(db.Model, TimestampMixin):
             "task_id": self.task_id,
             "content": self.content,
             "author": self.author,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            # datetimes are serialized by the orjson provider (RFC 3339)
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+# Column tuples for read-only listings: selecting plain rows skips ORM hydration
+TASK_COLS = (Task.id, Task.title, Task.description, Task.created_at, Task.updated_at)
+COMMENT_COLS = (
+    Comment.id,
+    Comment.task_id,
+    Comment.content,
+    Comment.author,
+    Comment.created_at,
+    Comment.updated_at,
+)
+
+# Comments are addressed by (task_id, id); built once so the SQL compile is cached
+COMMENT_BY_TASK_STMT = db.select(Comment).where(
+    Comment.task_id == bindparam("tid"), Comment.id == bindparam("cid")
+)
+
+
+# --------- Request schemas ---------
+# msgspec decodes and type-checks a request body in one pass. Required string
+# fields also accept null and handlers treat missing/null as "", so both still
+# reach the handlers' own "required" checks. UNSET marks fields absent from a
+# partial update.
+
+class TaskIn(msgspec.Struct):
+    title: Optional[str] = ""
+    description: Optional[str] = None
+
+
+class TaskUpdate(msgspec.Struct):
+    title: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+    description: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+
+
+class CommentIn(msgspec.Struct):
+    content: Optional[str] = ""
+    author: Optional[str] = None
+
+
+class CommentUpdate(msgspec.Struct):
+    content: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+    author: Union[Optional[str], msgspec.UnsetType] = msgspec.UNSET
+
+
+class BulkCommentsIn(msgspec.Struct):
+    items: List[CommentIn] = []
+
+
+# Keyset pagination bounds for list endpoints
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Constant response bodies, encoded once instead of per request
+HEALTH_BODY = orjson.dumps({"status": "ok"})
+DELETED_BODY = orjson.dumps({"data": {"deleted": True}})
+
+
+# --------- API ---------
+# Routes live on a module-level blueprint so the URL rules are declared once
+# per process; create_app only registers it.
+
+api_bp = Blueprint("api", __name__, url_prefix="/api")
+
+
+def health() -> Any:
+    return Response(HEALTH_BODY, status=200, mimetype="application/json")
+
+
+@click.command("init-db")
+@with_appcontext
+def init_db() -> None:
+    """Create database tables that do not exist yet."""
+    db.create_all()
+    click.echo("Initialized the database.")
+
+
+# ---- Error handlers ----
+@api_bp.app_errorhandler(404)
+def not_found(_):
+    return {"error": {"message": "Not found"}}, 404
+
+
+@api_bp.app_errorhandler(400)
+def bad_request(e):
+    message = getattr(e, "description", "Bad request")
+    return {"error": {"message": message}}, 400
+
+
+@api_bp.app_errorhandler(413)
+def payload_too_large(_):
+    return {"error": {"message": "Request body too large"}}, 413
+
+
+@api_bp.app_errorhandler(msgspec.DecodeError)
+def invalid_payload(e):
+    return {"error": {"message": f"Invalid request body: {e}"}}, 400
+
+
+@api_bp.app_errorhandler(500)
+def server_error(e):
+    current_app.logger.exception("Unhandled error: %s", e)
+    return {"error": {"message": "Internal Server Error"}}, 500
+
+
+# ---- Helpers ----
+def json_error(message: str, code: int = 400):
+    return {"error": {"message": message}}, code
+
+
+def decode_body(schema: type):
+    # Non-JSON or empty bodies decode as an empty object, as before; malformed
+    # or mistyped ones raise msgspec.DecodeError, handled as a 400
+    data = request.get_data() if request.is_json else b""
+    return msgspec.json.decode(data or b"{}", type=schema)
+
+
+def task_exists(task_id: int) -> bool:
+    return db.session.query(db.exists().where(Task.id == task_id)).scalar()
+
+
+def comment_content_error(content: str, empty_message: str) -> str | None:
+    if not 0 < len(content) <= MAX_COMMENT_LEN:
+        if not content:
+            return empty_message
+        return f"'content' must be <= {MAX_COMMENT_LEN} characters"
+    return None
+
+
+def comment_author_error(author: Optional[str]) -> str | None:
+    if author and len(author) > MAX_AUTHOR_LEN:
+        return f"'author' must be <= {MAX_AUTHOR_LEN} characters"
+    return None
+
+
+def get_page_args() -> Tuple[int, int]:
+    # Keyset cursor: rows with id > after, at most `limit` of them
+    after = request.args.get("after", 0, type=int)
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+    return max(after, 0), min(max(limit, 1), MAX_PAGE_SIZE)
+
+
+def comment_rows_to_dicts(rows) -> List[Dict[str, Any]]:
+    # Rows are selected with COMMENT_COLS
+    return [
+        {
+            "id": r[0],
+            "task_id": r[1],
+            "content": r[2],
+            "author": r[3],
+            "created_at": r[4],
+            "updated_at": r[5],
         }
+        for r in rows
+    ]
+
+
+def page_response(data: List[Dict[str, Any]], limit: int):
+    next_cursor = data[-1]["id"] if len(data) == limit else None
+    return {"data": data, "next_cursor": next_cursor}
+
+
+def make_etag(*parts: Any) -> str:
+    # Weak validator built from row counts / updated_at stamps; datetimes are
+    # rendered to the microsecond so back-to-back updates still differ
+    return "-".join(
+        p.strftime("%Y%m%d%H%M%S%f") if isinstance(p, datetime) else str(p) for p in parts
+    )
+
+
+def not_modified(etag: str) -> Response | None:
+    # Checked before loading or encoding anything, so a hit costs one query
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def with_etag(rv, etag: str):
+    response = current_app.make_response(rv)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+# ---- Task CRUD (supporting comments) ----
+@api_bp.get("/tasks")
+def list_tasks():
+    after, limit = get_page_args()
+    count, latest = db.session.execute(
+        db.select(db.func.count(Task.id), db.func.max(Task.updated_at))
+    ).one()
+    etag = make_etag(count, latest, after, limit)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    # lambda_stmt caches the compiled SQL; after/limit become bound parameters
+    rows = db.session.execute(lambda_stmt(
+        lambda: db.select(*TASK_COLS).where(Task.id > after).order_by(Task.id.asc()).limit(limit)
+    )).all()
+    return with_etag(page_response([
+        {"id": r[0], "title": r[1], "description": r[2], "created_at": r[3], "updated_at": r[4]}
+        for r in rows
+    ], limit), etag)
+
+
+@api_bp.post("/tasks")
+def create_task():
+    payload = decode_body(TaskIn)
+    title = (payload.title or "").strip()
+    if not title:
+        return json_error("'title' is required", 400)
+    description = payload.description
+    task = Task(title=title, description=description)
+    db.session.add(task)
+    db.session.commit()
+    return {"data": task.to_dict()}, 201
+
+
+@api_bp.get("/tasks/<int:task_id>")
+def get_task(task_id: int):
+    task = db.session.get(Task, task_id)
+    if not task:
+        return json_error("Task not found", 404)
+    etag = make_etag(task.id, task.updated_at)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    return with_etag({"data": task.to_dict()}, etag)
+
+
+@api_bp.put("/tasks/<int:task_id>")
+def update_task(task_id: int):
+    task = db.session.get(Task, task_id)
+    if not task:
+        return json_error("Task not found", 404)
+    payload = decode_body(TaskUpdate)
+    if payload.title is not msgspec.UNSET:
+        title = (payload.title or "").strip()
+        if not title:
+            return json_error("'title' cannot be empty", 400)
+        task.title = title
+    if payload.description is not msgspec.UNSET:
+        task.description = payload.description
+    db.session.commit()
+    return {"data": task.to_dict()}
+
+
+@api_bp.delete("/tasks/<int:task_id>")
+def delete_task(task_id: int):
+    task = db.session.get(Task, task_id)
+    if not task:
+        return json_error("Task not found", 404)
+    db.session.delete(task)
+    db.session.commit()
+    return Response(DELETED_BODY, status=200, mimetype="application/json")
+
+
+# ---- Comment CRUD (for a given task) ----
+@api_bp.get("/tasks/<int:task_id>/comments")
+def list_comments(task_id: int):
+    after, limit = get_page_args()
+    count, latest = db.session.execute(
+        db.select(db.func.count(Comment.id), db.func.max(Comment.updated_at))
+        .where(Comment.task_id == task_id)
+    ).one()
+    # Only a task without comments needs the parent lookup to tell 404 from "no comments"
+    if not count and not task_exists(task_id):
+        return json_error("Task not found", 404)
+    etag = make_etag(task_id, count, latest, after, limit)
+    cached = not_modified(etag)
+    if cached:
+        return cached
+    rows = db.session.execute(lambda_stmt(
+        lambda: db.select(*COMMENT_COLS)
+        .where(Comment.task_id == task_id, Comment.id > after)
+        .order_by(Comment.id.asc())
+        .limit(limit)
+    )).all()
+    return with_etag(page_response(comment_rows_to_dicts(rows), limit), etag)
+
+
+@api_bp.post("/tasks/<int:task_id>/comments")
+def create_comment(task_id: int):
+    payload = decode_body(CommentIn)
+    content = (payload.content or "").strip()
+    error = comment_content_error(content, "'content' is required")
+    if error:
+        return json_error(error, 400)
+    author = (payload.author or None)
+    error = comment_author_error(author)
+    if error:
+        return json_error(error, 400)
+    comment = Comment(task_id=task_id, content=content, author=author)
+    db.session.add(comment)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # The FK on task_id is the existence check for the parent task
+        db.session.rollback()
+        return json_error("Task not found", 404)
+    return {"data": comment.to_dict()}, 201
+
+
+@api_bp.post("/tasks/<int:task_id>/comments/bulk")
+def create_comments_bulk(task_id: int):
+    items = decode_body(BulkCommentsIn).items
+    if not items:
+        return json_error("'items' must be a non-empty list", 400)
+    if len(items) > MAX_BULK_COMMENTS:
+        return json_error(f"'items' must contain <= {MAX_BULK_COMMENTS} comments", 400)
+    values = []
+    for i, item in enumerate(items):
+        content = (item.content or "").strip()
+        error = comment_content_error(content, "'content' is required")
+        if error:
+            return json_error(f"items[{i}]: {error}", 400)
+        author = item.author or None
+        error = comment_author_error(author)
+        if error:
+            return json_error(f"items[{i}]: {error}", 400)
+        values.append({"task_id": task_id, "content": content, "author": author})
+    # One multi-row INSERT ... RETURNING and a single commit for the whole batch
+    try:
+        rows = db.session.execute(
+            db.insert(Comment).returning(*COMMENT_COLS, sort_by_parameter_order=True), values
+        ).all()
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return json_error("Task not found", 404)
+    return {"data": comment_rows_to_dicts(rows)}, 201
+
+
+@api_bp.put("/tasks/<int:task_id>/comments/<int:comment_id>")
+def update_comment(task_id: int, comment_id: int):
+    comment = db.session.execute(
+        COMMENT_BY_TASK_STMT, {"tid": task_id, "cid": comment_id}
+    ).scalar_one_or_none()
+    if not comment:
+        if not task_exists(task_id):
+            return json_error("Task not found", 404)
+        return json_error("Comment not found", 404)
+    payload = decode_body(CommentUpdate)
+    if payload.content is not msgspec.UNSET:
+        content = (payload.content or "").strip()
+        error = comment_content_error(content, "'content' cannot be empty")
+        if error:
+            return json_error(error, 400)
+        comment.content = content
+    if payload.author is not msgspec.UNSET:
+        author = (payload.author or None)
+        error = comment_author_error(author)
+        if error:
+            return json_error(error, 400)
+        comment.author = author
+    db.session.commit()
+    return {"data": comment.to_dict()}
+
+
+@api_bp.delete("/tasks/<int:task_id>/comments/<int:comment_id>")
+def delete_comment(task_id: int, comment_id: int):
+    comment = db.session.execute(
+        COMMENT_BY_TASK_STMT, {"tid": task_id, "cid": comment_id}
+    ).scalar_one_or_none()
+    if not comment:
+        if not task_exists(task_id):
+            return json_error("Task not found", 404)
+        return json_error("Comment not found", 404)
+    db.session.delete(comment)
+    db.session.commit()
+    return Response(DELETED_BODY, status=200, mimetype="application/json")
 
 
 # --------- App Factory ---------
 
 def create_app(config: Dict[str, Any] | None = None) -> Flask:
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Defaults suitable for local development; tests can override in fixture
     # Ensure instance folder exists and default DB is stored there to avoid path/permission issues
@@ -70,159 +498,33 @@ def create_app(config: Dict[str, Any] | None = None) -> Flask:
     app.config.setdefault("SQLALCHEMY_DATABASE_URI", os.getenv("DATABASE_URL", f"sqlite:///{default_db}"))
     app.config.setdefault("SQLALCHEMY_TRACK_MODIFICATIONS", False)
     app.config.setdefault("JSON_SORT_KEYS", False)
+    app.config.setdefault(
+        "AUTO_CREATE_TABLES", os.getenv("AUTO_CREATE_TABLES", "1") not in ("0", "false", "False")
+    )
+    app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BYTES  # Flask defaults this to None
 
     if config:
         app.config.update(config)
+    app.config.setdefault(
+        "SQLALCHEMY_ENGINE_OPTIONS", engine_options_for(app.config["SQLALCHEMY_DATABASE_URI"])
+    )
 
     db.init_app(app)
+    # Scoped to this app's engine; registered before anything opens a connection
+    if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite:"):
+        with app.app_context():
+            event.listen(db.engine, "connect", _set_sqlite_pragmas)
 
     # Register blueprints
-    api_bp = Blueprint("api", __name__, url_prefix="/api")
-
-    @app.get("/health")
-    def health() -> Any:
-        return jsonify({"status": "ok"})
-
-    # ---- Error handlers ----
-    @app.errorhandler(404)
-    def not_found(_):
-        return jsonify({"error": {"message": "Not found"}}), 404
-
-    @app.errorhandler(400)
-    def bad_request(e):
-        message = getattr(e, "description", "Bad request")
-        return jsonify({"error": {"message": message}}), 400
-
-    @app.errorhandler(500)
-    def server_error(e):
-        app.logger.exception("Unhandled error: %s", e)
-        return jsonify({"error": {"message": "Internal Server Error"}}), 500
-
-    # ---- Helpers ----
-    def json_error(message: str, code: int = 400):
-        return jsonify({"error": {"message": message}}), code
-
-    def get_json() -> Dict[str, Any]:
-        if not request.is_json:
-            return {}
-        data = request.get_json(silent=True)
-        return data or {}
-
-    # ---- Task CRUD (supporting comments) ----
-    @api_bp.get("/tasks")
-    def list_tasks():
-        tasks = Task.query.order_by(Task.id.asc()).all()
-        return jsonify({"data": [t.to_dict() for t in tasks]})
-
-    @api_bp.post("/tasks")
-    def create_task():
-        payload = get_json()
-        title = (payload.get("title") or "").strip()
-        if not title:
-            return json_error("'title' is required", 400)
-        description = payload.get("description")
-        task = Task(title=title, description=description)
-        db.session.add(task)
-        db.session.commit()
-        return jsonify({"data": task.to_dict()}), 201
-
-    @api_bp.get("/tasks/<int:task_id>")
-    def get_task(task_id: int):
-        task = Task.query.get(task_id)
-        if not task:
-            return json_error("Task not found", 404)
-        return jsonify({"data": task.to_dict()})
-
-    @api_bp.put("/tasks/<int:task_id>")
-    def update_task(task_id: int):
-        task = Task.query.get(task_id)
-        if not task:
-            return json_error("Task not found", 404)
-        payload = get_json()
-        if "title" in payload:
-            title = (payload.get("title") or "").strip()
-            if not title:
-                return json_error("'title' cannot be empty", 400)
-            task.title = title
-        if "description" in payload:
-            task.description = payload.get("description")
-        db.session.commit()
-        return jsonify({"data": task.to_dict()})
-
-    @api_bp.delete("/tasks/<int:task_id>")
-    def delete_task(task_id: int):
-        task = Task.query.get(task_id)
-        if not task:
-            return json_error("Task not found", 404)
-        db.session.delete(task)
-        db.session.commit()
-        return jsonify({"data": {"deleted": True}})
-
-    # ---- Comment CRUD (for a given task) ----
-    @api_bp.get("/tasks/<int:task_id>/comments")
-    def list_comments(task_id: int):
-        task = Task.query.get(task_id)
-        if not task:
-            return json_error("Task not found", 404)
-        comments = Comment.query.filter_by(task_id=task_id).order_by(Comment.id.asc()).all()
-        return jsonify({"data": [c.to_dict() for c in comments]})
-
-    @api_bp.post("/tasks/<int:task_id>/comments")
-    def create_comment(task_id: int):
-        task = Task.query.get(task_id)
-        if not task:
-            return json_error("Task not found", 404)
-        payload = get_json()
-        content = (payload.get("content") or "").strip()
-        if not content:
-            return json_error("'content' is required", 400)
-        if len(content) > 1000:
-            return json_error("'content' must be <= 1000 characters", 400)
-        author = (payload.get("author") or None)
-        comment = Comment(task_id=task.id, content=content, author=author)
-        db.session.add(comment)
-        db.session.commit()
-        return jsonify({"data": comment.to_dict()}), 201
-
-    @api_bp.put("/tasks/<int:task_id>/comments/<int:comment_id>")
-    def update_comment(task_id: int, comment_id: int):
-        task = Task.query.get(task_id)
-        if not task:
-            return json_error("Task not found", 404)
-        comment = Comment.query.filter_by(task_id=task_id, id=comment_id).first()
-        if not comment:
-            return json_error("Comment not found", 404)
-        payload = get_json()
-        if "content" in payload:
-            content = (payload.get("content") or "").strip()
-            if not content:
-                return json_error("'content' cannot be empty", 400)
-            if len(content) > 1000:
-                return json_error("'content' must be <= 1000 characters", 400)
-            comment.content = content
-        if "author" in payload:
-            author = payload.get("author")
-            comment.author = (author or None)
-        db.session.commit()
-        return jsonify({"data": comment.to_dict()})
-
-    @api_bp.delete("/tasks/<int:task_id>/comments/<int:comment_id>")
-    def delete_comment(task_id: int, comment_id: int):
-        task = Task.query.get(task_id)
-        if not task:
-            return json_error("Task not found", 404)
-        comment = Comment.query.filter_by(task_id=task_id, id=comment_id).first()
-        if not comment:
-            return json_error("Comment not found", 404)
-        db.session.delete(comment)
-        db.session.commit()
-        return jsonify({"data": {"deleted": True}})
-
+    app.add_url_rule("/health", view_func=health, methods=["GET"])
     app.register_blueprint(api_bp)
+    app.cli.add_command(init_db)
 
-    # Create DB tables if not present (local dev convenience)
-    with app.app_context():
-        db.create_all()
+    # Create DB tables if not present (local dev convenience); deployments can
+    # set AUTO_CREATE_TABLES=0 in the environment and run `flask init-db` once instead
+    if app.config["AUTO_CREATE_TABLES"]:
+        with app.app_context():
+            db.create_all()
 
     return app
 
@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy.pool import StaticPool
+
+from backend.app import create_app, db, Task
+
+
+@pytest.fixture()
+def app():
+    # In-memory SQLite per test; StaticPool keeps the single connection (and
+    # therefore the database) alive across sessions and threads
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "SQLALCHEMY_ENGINE_OPTIONS": {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        },
+        "AUTO_CREATE_TABLES": False,
+    })
+    with app.app_context():
+        db.create_all()
+
+    yield app
+
+    # Teardown
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture()
+def task_id(app):
+    with app.app_context():
+        t = Task(title="Test Task", description="desc")
+        db.session.add(t)
+        db.session.commit()
+        return t.id
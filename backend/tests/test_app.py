@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.pool import StaticPool
+
+from backend.app import create_app, db, Task
+
+
+def test_sqlite_pragmas(app):
+    with app.app_context():
+        conn = db.session.connection()
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+
+
+def test_health(client):
+    resp = client.get("/health")
+    assert resp.status_code == 200
+    assert resp.is_json
+    assert resp.get_json() == {"status": "ok"}
+
+
+@pytest.mark.parametrize("flag, created", [("0", False), ("false", False), ("1", True)])
+def test_auto_create_tables_env_flag(monkeypatch, flag, created):
+    monkeypatch.setenv("AUTO_CREATE_TABLES", flag)
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "SQLALCHEMY_ENGINE_OPTIONS": {"poolclass": StaticPool},
+    })
+    with app.app_context():
+        assert sa_inspect(db.engine).has_table("tasks") is created
+
+
+def test_init_db_command(app):
+    with app.app_context():
+        db.drop_all()
+    result = app.test_cli_runner().invoke(args=["init-db"])
+    assert result.exit_code == 0
+    with app.app_context():
+        assert db.session.query(Task).count() == 0
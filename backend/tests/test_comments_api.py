@@ -1,53 +1,61 @@
 import json
-import os
-import tempfile
+from datetime import datetime
+
 import pytest
 
-from backend.app import create_app, db, Task, Comment
+from backend.app import (
+    MAX_AUTHOR_LEN,
+    MAX_BULK_COMMENTS,
+    MAX_COMMENT_LEN,
+    MAX_REQUEST_BYTES,
+)
 
 
-@pytest.fixture()
-def app():
-    # Use a temporary SQLite database per test session
-    db_fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(db_fd)
+def test_list_comments_initially_empty(client, task_id):
+    resp = client.get(f"/api/tasks/{task_id}/comments")
+    assert resp.status_code == 200
+    payload = resp.get_json()
+    assert payload["data"] == []
 
-    app = create_app({
-        "TESTING": True,
-        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{db_path}",
-    })
 
-    yield app
+def test_list_comments_returns_created_in_order(client, task_id):
+    for content in ("one", "two"):
+        client.post(f"/api/tasks/{task_id}/comments", json={"content": content, "author": "alice"})
+    resp = client.get(f"/api/tasks/{task_id}/comments")
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert [c["content"] for c in data] == ["one", "two"]
+    assert data[0]["task_id"] == task_id
+    assert data[0]["author"] == "alice"
+    assert data[0]["created_at"]
 
-    # Teardown
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
-    try:
-        os.remove(db_path)
-    except FileNotFoundError:
-        pass
 
+def test_list_comments_keyset_pagination(client, task_id):
+    for i in range(3):
+        client.post(f"/api/tasks/{task_id}/comments", json={"content": f"c{i}"})
+    first = client.get(f"/api/tasks/{task_id}/comments?limit=2").get_json()
+    assert [c["content"] for c in first["data"]] == ["c0", "c1"]
+    assert first["next_cursor"] == first["data"][-1]["id"]
 
-@pytest.fixture()
-def client(app):
-    return app.test_client()
+    second = client.get(f"/api/tasks/{task_id}/comments?limit=2&after={first['next_cursor']}").get_json()
+    assert [c["content"] for c in second["data"]] == ["c2"]
+    assert second["next_cursor"] is None
 
 
-@pytest.fixture()
-def task_id(app):
-    with app.app_context():
-        t = Task(title="Test Task", description="desc")
-        db.session.add(t)
-        db.session.commit()
-        return t.id
+def test_list_comments_not_modified(client, task_id):
+    client.post(f"/api/tasks/{task_id}/comments", json={"content": "c1"})
+    first = client.get(f"/api/tasks/{task_id}/comments")
+    etag = first.headers["ETag"]
+    assert etag.startswith("W/")
 
+    cached = client.get(f"/api/tasks/{task_id}/comments", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
 
-def test_list_comments_initially_empty(client, task_id):
-    resp = client.get(f"/api/tasks/{task_id}/comments")
-    assert resp.status_code == 200
-    payload = resp.get_json()
-    assert payload["data"] == []
+    client.post(f"/api/tasks/{task_id}/comments", json={"content": "c2"})
+    changed = client.get(f"/api/tasks/{task_id}/comments", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.get_json()["data"]) == 2
 
 
 def test_create_comment_success(client, task_id):
@@ -60,6 +68,8 @@ def test_create_comment_success(client, task_id):
     assert data["content"] == "First comment"
     assert data["author"] == "alice"
     assert data["task_id"] == task_id
+    # Timestamps are emitted as RFC 3339 strings by the JSON provider
+    assert datetime.fromisoformat(data["created_at"]).tzinfo is not None
 
 
 def test_create_comment_validation(client, task_id):
@@ -75,6 +85,77 @@ def test_create_comment_validation(client, task_id):
         json={"content": "x" * 1001},
     )
     assert resp.status_code == 400
+    # Over length author
+    resp = client.post(
+        f"/api/tasks/{task_id}/comments",
+        json={"content": "ok", "author": "a" * (MAX_AUTHOR_LEN + 1)},
+    )
+    assert resp.status_code == 400
+    assert "'author'" in resp.get_json()["error"]["message"]
+    # Null content is treated like missing content
+    resp = client.post(f"/api/tasks/{task_id}/comments", json={"content": None})
+    assert resp.status_code == 400
+    assert resp.get_json()["error"]["message"] == "'content' is required"
+    # Wrong type is rejected by the request schema
+    resp = client.post(f"/api/tasks/{task_id}/comments", json={"content": 123})
+    assert resp.status_code == 400
+    assert "$.content" in resp.get_json()["error"]["message"]
+    # Oversized body is rejected before parsing
+    resp = client.post(
+        f"/api/tasks/{task_id}/comments",
+        json={"content": "x" * (MAX_REQUEST_BYTES + 1)},
+    )
+    assert resp.status_code == 413
+
+
+def test_bulk_create_comments(client, task_id):
+    resp = client.post(
+        f"/api/tasks/{task_id}/comments/bulk",
+        json={"items": [{"content": "a", "author": "alice"}, {"content": " b "}]},
+    )
+    assert resp.status_code == 201
+    data = resp.get_json()["data"]
+    assert [c["content"] for c in data] == ["a", "b"]
+    assert [c["author"] for c in data] == ["alice", None]
+    assert data[0]["id"] < data[1]["id"]
+
+    listed = client.get(f"/api/tasks/{task_id}/comments").get_json()["data"]
+    assert [c["id"] for c in listed] == [c["id"] for c in data]
+
+
+@pytest.mark.parametrize("char", ["x", "\u00e9", "\U0001f600"])
+def test_bulk_create_full_size_batch(client, task_id, char):
+    items = [{"content": char * MAX_COMMENT_LEN, "author": char * MAX_AUTHOR_LEN}] * MAX_BULK_COMMENTS
+    # json.dumps escapes non-ASCII (\uXXXX, surrogate pairs for astral), the
+    # largest encoding a client is likely to send
+    resp = client.post(
+        f"/api/tasks/{task_id}/comments/bulk",
+        data=json.dumps({"items": items}),
+        content_type="application/json",
+    )
+    assert resp.status_code == 201
+    data = resp.get_json()["data"]
+    assert len(data) == MAX_BULK_COMMENTS
+    assert data[0]["content"] == char * MAX_COMMENT_LEN
+
+
+def test_bulk_create_comments_validation(client, task_id):
+    resp = client.post(f"/api/tasks/{task_id}/comments/bulk", json={"items": []})
+    assert resp.status_code == 400
+    resp = client.post(
+        f"/api/tasks/{task_id}/comments/bulk",
+        json={"items": [{"content": "ok"}, {"content": "  "}]},
+    )
+    assert resp.status_code == 400
+    assert resp.get_json()["error"]["message"].startswith("items[1]")
+    resp = client.post(
+        f"/api/tasks/{task_id}/comments/bulk",
+        json={"items": [{"content": "ok"}, {"content": "ok", "author": "a" * (MAX_AUTHOR_LEN + 1)}]},
+    )
+    assert resp.status_code == 400
+    assert resp.get_json()["error"]["message"].startswith("items[1]: 'author'")
+    # Nothing from a rejected batch is stored
+    assert client.get(f"/api/tasks/{task_id}/comments").get_json()["data"] == []
 
 
 def test_update_comment_success(client, task_id):
@@ -101,6 +182,18 @@ def test_update_comment_success(client, task_id):
         json={"content": "   "},
     )
     assert bad.status_code == 400
+    bad = client.put(
+        f"/api/tasks/{task_id}/comments/{cid}",
+        json={"author": "a" * (MAX_AUTHOR_LEN + 1)},
+    )
+    assert bad.status_code == 400
+    assert "'author'" in bad.get_json()["error"]["message"]
+    bad = client.put(
+        f"/api/tasks/{task_id}/comments/{cid}",
+        json={"content": None},
+    )
+    assert bad.status_code == 400
+    assert bad.get_json()["error"]["message"] == "'content' cannot be empty"
 
 
 def test_delete_comment_success(client, task_id):
@@ -126,7 +219,16 @@ def test_comment_routes_require_existing_task(client):
     assert resp.status_code == 404
     resp = client.post("/api/tasks/9999/comments", json={"content": "x"})
     assert resp.status_code == 404
+    resp = client.post("/api/tasks/9999/comments/bulk", json={"items": [{"content": "x"}]})
+    assert resp.status_code == 404
     resp = client.put("/api/tasks/9999/comments/1", json={"content": "x"})
     assert resp.status_code == 404
     resp = client.delete("/api/tasks/9999/comments/1")
     assert resp.status_code == 404
+    assert resp.get_json()["error"]["message"] == "Task not found"
+
+
+def test_missing_comment_on_existing_task(client, task_id):
+    resp = client.put(f"/api/tasks/{task_id}/comments/9999", json={"content": "x"})
+    assert resp.status_code == 404
+    assert resp.get_json()["error"]["message"] == "Comment not found"
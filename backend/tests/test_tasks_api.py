@@ -0,0 +1,76 @@
+def test_create_task_success(client):
+    resp = client.post("/api/tasks", json={"title": "  Write docs  ", "description": "d"})
+    assert resp.status_code == 201
+    data = resp.get_json()["data"]
+    assert data["title"] == "Write docs"
+    assert data["description"] == "d"
+
+
+def test_create_task_validation(client):
+    # Missing and null titles get the handler's own message
+    for body in ({}, {"title": None}, {"title": "   "}):
+        resp = client.post("/api/tasks", json=body)
+        assert resp.status_code == 400
+        assert resp.get_json()["error"]["message"] == "'title' is required"
+    # Wrong type is rejected by the request schema
+    resp = client.post("/api/tasks", json={"title": 123})
+    assert resp.status_code == 400
+    assert "$.title" in resp.get_json()["error"]["message"]
+    # Non-object bodies are rejected too
+    resp = client.post("/api/tasks", json=["title"])
+    assert resp.status_code == 400
+
+
+def test_update_task_partial(client, task_id):
+    # Only fields present in the body change; null clears the description
+    resp = client.put(f"/api/tasks/{task_id}", json={"description": None})
+    assert resp.status_code == 200
+    data = resp.get_json()["data"]
+    assert data["title"] == "Test Task"
+    assert data["description"] is None
+
+    resp = client.put(f"/api/tasks/{task_id}", json={"title": "Renamed"})
+    assert resp.get_json()["data"]["title"] == "Renamed"
+
+
+def test_update_task_validation(client, task_id):
+    for body in ({"title": None}, {"title": "  "}):
+        resp = client.put(f"/api/tasks/{task_id}", json=body)
+        assert resp.status_code == 400
+        assert resp.get_json()["error"]["message"] == "'title' cannot be empty"
+    resp = client.put("/api/tasks/9999", json={"title": "x"})
+    assert resp.status_code == 404
+
+
+def test_get_task_not_modified(client, task_id):
+    first = client.get(f"/api/tasks/{task_id}")
+    etag = first.headers["ETag"]
+    assert etag.startswith("W/")
+
+    cached = client.get(f"/api/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    client.put(f"/api/tasks/{task_id}", json={"title": "Renamed"})
+    changed = client.get(f"/api/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.get_json()["data"]["title"] == "Renamed"
+
+
+def test_list_tasks_not_modified(client, task_id):
+    first = client.get("/api/tasks")
+    etag = first.headers["ETag"]
+
+    cached = client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
+    # The page parameters are part of the validator
+    other_page = client.get("/api/tasks?limit=1", headers={"If-None-Match": etag})
+    assert other_page.status_code == 200
+
+    client.put(f"/api/tasks/{task_id}", json={"description": "changed"})
+    changed = client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.get_json()["data"][0]["description"] == "changed"
@@ -22,9 +22,22 @@ async function http(path, options = {}) {
   return body;
 }
 
+// List endpoints are keyset-paginated; follow next_cursor until the last page
+async function listAll(path) {
+  const data = [];
+  let after = null;
+  do {
+    const query = after === null ? "" : `&after=${after}`;
+    const page = await http(`${path}?limit=1000${query}`);
+    data.push(...page.data);
+    after = page.next_cursor;
+  } while (after !== null && after !== undefined);
+  return { data };
+}
+
 // Tasks
 export function listTasks() {
-  return http("/api/tasks");
+  return listAll("/api/tasks");
 }
 export function createTask({ title, description }) {
   return http("/api/tasks", { method: "POST", body: JSON.stringify({ title, description }) });
@@ -38,7 +51,7 @@ export function deleteTask(id) {
 
 // Comments
 export function listComments(taskId) {
-  return http(`/api/tasks/${taskId}/comments`);
+  return listAll(`/api/tasks/${taskId}/comments`);
 }
 export function createComment(taskId, { content, author }) {
   return http(`/api/tasks/${taskId}/comments`, { method: "POST", body: JSON.stringify({ content, author }) });